@@ -2,9 +2,10 @@
 API Routes - Analysis Endpoints
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, status, Depends, Request
+from fastapi.responses import Response
 from typing import Optional
+import asyncio
 import time
 from datetime import datetime
 from bson import ObjectId
@@ -33,9 +34,6 @@ from app.models.schemas import (
     GitHubAnalysisResult,
     UserInDB,
 )
-from app.nlp import nlp_service
-from app.ml import ml_service
-from app.llm import llm_service
 from app import scraper
 from app.core.dependencies import get_current_user
 from app.db import (
@@ -128,13 +126,22 @@ async def analyze_text(
     
     **Requires authentication**
     """
+    # Model-backed services are imported on first use so loading the router stays cheap
+    from app.nlp import get_nlp_service
+    from app.ml import get_ml_service
+    from app.llm import llm_service
+    
     start_time = time.time()
     
     try:
+        nlp_service = get_nlp_service()
+        ml_service = get_ml_service()
+        
         # Step 1: NLP - Detect PII
+        text_lower = request.text.lower()
         pii_entities = nlp_service.detect_pii(request.text)
         entity_counts = nlp_service.extract_entity_counts(pii_entities)
-        sensitive_keywords = nlp_service.detect_sensitive_keywords(request.text)
+        sensitive_keywords = nlp_service.detect_sensitive_keywords(request.text, text_lower)
         
         # Step 2: Extract features
         features = ml_service.extract_features(
@@ -168,6 +175,7 @@ async def analyze_text(
         
         # Generate analysis ID
         analysis_id = str(ObjectId())
+        features_schema = features.to_schema()
         
         # Step 5: Save to database or memory (use authenticated user_id)
         analysis_doc = {
@@ -175,7 +183,7 @@ async def analyze_text(
             "user_id": current_user.user_id,
             "input_text": request.text,
             "pii_entities": [e.dict() for e in pii_entities],
-            "features": features.dict(),
+            "features": features_schema.dict(),
             "risk_score": risk_score.dict(),
             "recommendations": recommendations,
             "safe_rewrite": safe_rewrite,
@@ -194,7 +202,7 @@ async def analyze_text(
             analysis_id=analysis_id,
             input_text=request.text,
             pii_entities=pii_entities,
-            features=features,
+            features=features_schema,
             risk_score=risk_score,
             recommendations=recommendations,
             safe_rewrite=safe_rewrite,
@@ -247,8 +255,11 @@ async def score_training_attempt(payload: TrainingAttemptRequest):
 
     challenge = TRAINING_CHALLENGES[payload.challenge_id]
 
+    from app.nlp import get_nlp_service
+
     try:
         # Detect PII in original and user text
+        nlp_service = get_nlp_service()
         original_pii = nlp_service.detect_pii(challenge.risky_text)
         user_pii = nlp_service.detect_pii(payload.user_text)
 
@@ -389,6 +400,7 @@ async def get_risk_report(
 @router.get("/export-pdf/{analysis_id}")
 async def export_pdf_report(
     analysis_id: str,
+    request: Request,
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
@@ -430,13 +442,22 @@ async def export_pdf_report(
             "timestamp": result.get("timestamp")
         }
         
-        # Generate PDF
-        from app.utils.pdf_generator import pdf_generator
-        pdf_buffer = pdf_generator.generate_analysis_report(analysis_data)
+        # Generate PDF in the process pool (default executor if it isn't running),
+        # unless the same report content was rendered recently
+        from app.utils.pdf_generator import (
+            cache_pdf, get_cached_pdf, pdf_cache_key, render_pdf_bytes
+        )
+        cache_key = pdf_cache_key(analysis_data)
+        pdf_bytes = get_cached_pdf(cache_key)
+        if pdf_bytes is None:
+            pdf_pool = getattr(request.app.state, "pdf_pool", None)
+            pdf_bytes = await asyncio.get_running_loop().run_in_executor(
+                pdf_pool, render_pdf_bytes, analysis_data
+            )
+            cache_pdf(cache_key, pdf_bytes)
         
-        # Return as streaming response
-        return StreamingResponse(
-            pdf_buffer,
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename=privacy-report-{analysis_id}.pdf"
@@ -655,6 +676,8 @@ async def privacy_chat(request: PrivacyChatRequest):
     Users can ask conceptual questions like "Is it safe to share Aadhaar on WhatsApp?"
     and receive general best-practice guidance. This does NOT store any history.
     """
+    from app.llm import llm_service
+    
     if not llm_service.enabled:
         return PrivacyChatResponse(
             answer=(
@@ -710,12 +733,19 @@ async def analyze_profile_risk(request: ProfileRiskRequest):
     This reuses the existing NLP/ML/LLM pipeline. For now, a placeholder text
     is generated based on the identifier instead of scraping.
     """
+    from app.nlp import get_nlp_service
+    from app.ml import get_ml_service
+    from app.llm import llm_service
+    
     try:
         profile_text = await _fetch_profile_text(request)
+        nlp_service = get_nlp_service()
+        ml_service = get_ml_service()
 
+        profile_text_lower = profile_text.lower()
         pii_entities = nlp_service.detect_pii(profile_text)
         entity_counts = nlp_service.extract_entity_counts(pii_entities)
-        sensitive_keywords = nlp_service.detect_sensitive_keywords(profile_text)
+        sensitive_keywords = nlp_service.detect_sensitive_keywords(profile_text, profile_text_lower)
 
         features = ml_service.extract_features(
             profile_text,
@@ -744,7 +774,7 @@ async def analyze_profile_risk(request: ProfileRiskRequest):
             analysis_id="profile-demo",  # not persisted currently
             input_text=profile_text,
             pii_entities=pii_entities,
-            features=features,
+            features=features.to_schema(),
             risk_score=risk_score,
             recommendations=recommendations,
             safe_rewrite=safe_rewrite,
@@ -911,6 +941,8 @@ async def assistant_chat(request: AssistantChatRequest):
     
     Provides conversational privacy advice and guidance using Gemini/OpenAI.
     """
+    from app.llm import llm_service
+    
     try:
         # Get response from LLM service
         answer = llm_service.answer_privacy_question(
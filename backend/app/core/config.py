@@ -59,6 +59,13 @@ class Settings(BaseSettings):
     # NLP Models
     SPACY_MODEL: str = "en_core_web_sm"  # Using smaller model for faster setup
     
+    # Load NLP/ML models when the app module is imported, so pre-fork
+    # servers (gunicorn --preload) share them across workers
+    PRELOAD_MODELS: bool = False
+    
+    # Worker processes for PDF export (capped at the CPU count)
+    PDF_WORKERS: int = 2
+    
     # ML Model Paths
     ML_MODEL_PATH: str = "./app/ml/models/risk_classifier.pkl"
     ML_VECTORIZER_PATH: str = "./app/ml/models/vectorizer.pkl"
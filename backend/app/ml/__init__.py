@@ -1,5 +1,5 @@
 """Machine Learning module for risk scoring"""
 
-from .risk_scorer import ml_service
+from .risk_scorer import get_ml_service, FeaturesInternal
 
-__all__ = ["ml_service"]
+__all__ = ["get_ml_service", "FeaturesInternal"]
@@ -8,12 +8,107 @@ import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
+from dataclasses import dataclass, asdict
+from functools import cache
 from typing import Tuple, Dict
 import os
 
 from app.models.schemas import Features, RiskScore, RiskLevel
 from app.core.config import settings
 
+try:  # Numba is optional; without it the scoring kernel runs as plain Python
+    import numba
+except ImportError:  # pragma: no cover - handled by the fallback below
+    numba = None
+
+
+# Rule-based features in kernel order. Each is mapped onto [0, 1] as
+# x / divisor * multiplier; the identity factors are exact, so every term
+# matches the baseline's "/ 3" or "* 100" bit for bit
+_RB_FEATURES = (
+    "num_emails", "num_phones", "num_locations", "num_persons",
+    "num_organizations", "text_length", "entity_density", "sensitive_keywords"
+)
+_RB_DIVISORS = np.array([3.0, 2.0, 5.0, 3.0, 3.0, 1000.0, 1.0, 5.0])
+_RB_MULTIPLIERS = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 100.0, 1.0])
+_RB_ATTRS = (
+    "num_emails", "num_phones", "num_locations", "num_persons",
+    "num_organizations", "text_length", "entity_density", "sensitive_keywords_count"
+)
+
+# Class index -> risk level, and the score each class contributes
+_RISK_LEVEL_BY_IDX = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)
+_PROB_WEIGHTS = np.array([25.0, 60.0, 100.0])
+
+
+def _rb_kernel(vals, divs, muls, weights, low_th, med_th):
+    """Weighted sum of clipped, normalized features and its risk level index"""
+    s = 0.0
+    for i in range(vals.shape[0]):
+        v = vals[i] / divs[i] * muls[i]
+        if v > 1.0:
+            v = 1.0
+        s += v * weights[i]
+    lvl = 0 if s < low_th else (1 if s < med_th else 2)
+    return s, lvl
+
+
+if numba is not None:
+    _rb_kernel = numba.njit(cache=True)(_rb_kernel)
+
+
+def _compile_rule_scorer(weights: Dict[str, float], low_th: float, med_th: float):
+    """
+    Generate a straight-line scorer with weights and thresholds baked in
+    
+    Used when Numba is unavailable; the generated function takes a
+    FeaturesInternal and returns (score, level_idx) like _rb_kernel.
+    """
+    def normalized(attr, div, mul):
+        if mul != 1.0:
+            return f"f.{attr} * {float(mul)!r}"
+        return f"f.{attr} / {float(div)!r}"
+    
+    terms = " + ".join(
+        f"min({normalized(attr, div, mul)}, 1.0) * {float(weights.get(name, 0.1))!r}"
+        for name, attr, div, mul in zip(_RB_FEATURES, _RB_ATTRS, _RB_DIVISORS, _RB_MULTIPLIERS)
+    )
+    src = (
+        "def _rb(f):\n"
+        f"    s = 0.0 + {terms}\n"
+        f"    if s < {float(low_th)!r}:\n"
+        "        return s, 0\n"
+        f"    if s < {float(med_th)!r}:\n"
+        "        return s, 1\n"
+        "    return s, 2\n"
+    )
+    namespace = {}
+    exec(src, namespace)
+    return namespace["_rb"]
+
+
+@dataclass(slots=True)
+class FeaturesInternal:
+    """
+    Extracted features used inside the ML pipeline
+
+    Slotted dataclass mirror of the ``Features`` schema; the Pydantic model
+    is only built at the HTTP boundary via ``to_schema``.
+    """
+    num_emails: int = 0
+    num_phones: int = 0
+    num_locations: int = 0
+    num_persons: int = 0
+    num_organizations: int = 0
+    num_dates: int = 0
+    text_length: int = 0
+    entity_density: float = 0.0
+    sensitive_keywords_count: int = 0
+
+    def to_schema(self) -> Features:
+        """Build the response schema without re-running validation"""
+        return Features.model_construct(**asdict(self))
+
 
 class MLService:
     """Machine Learning service for risk scoring"""
@@ -23,6 +118,7 @@ class MLService:
         self.scaler = None
         self.model_type = "rule_based"  # Start with rule-based, upgrade to ML
         self._initialize()
+        self._initialize_rule_kernel()
     
     def _initialize(self):
         """Initialize or load ML model"""
@@ -31,8 +127,10 @@ class MLService:
         # Try to load pre-trained model
         if os.path.exists(model_path):
             try:
-                self.model = joblib.load(model_path)
-                self.scaler = joblib.load(settings.ML_VECTORIZER_PATH)
+                # Memory-map the estimator arrays so pre-forked workers share
+                # the same page-cache copy (requires uncompressed dumps)
+                self.model = joblib.load(model_path, mmap_mode='r')
+                self.scaler = joblib.load(settings.ML_VECTORIZER_PATH, mmap_mode='r')
                 self.model_type = "trained"
                 print(f"✅ Loaded trained ML model from {model_path}")
             except Exception as e:
@@ -50,8 +148,42 @@ class MLService:
         self.scaler = StandardScaler()
         self.model_type = "rule_based"
     
+    def _initialize_rule_kernel(self):
+        """Prepare the rule-based scorer for the current FEATURE_WEIGHTS"""
+        weights = settings.FEATURE_WEIGHTS
+        
+        if numba is None:
+            self._rb = _compile_rule_scorer(
+                weights, settings.RISK_LOW_THRESHOLD, settings.RISK_MEDIUM_THRESHOLD
+            )
+            return
+        
+        self._rb_weights = np.array([weights.get(name, 0.1) for name in _RB_FEATURES])
+        self._rb = self._rb_jit
+        
+        # First call triggers JIT compilation; do it now instead of per request
+        self._rb(FeaturesInternal())
+    
+    def _rb_jit(self, features: FeaturesInternal) -> Tuple[float, int]:
+        """Score features with the Numba kernel"""
+        vals = np.array([
+            features.num_emails,
+            features.num_phones,
+            features.num_locations,
+            features.num_persons,
+            features.num_organizations,
+            features.text_length,
+            features.entity_density,
+            features.sensitive_keywords_count
+        ], dtype=np.float64)
+        
+        return _rb_kernel(
+            vals, _RB_DIVISORS, _RB_MULTIPLIERS, self._rb_weights,
+            settings.RISK_LOW_THRESHOLD, settings.RISK_MEDIUM_THRESHOLD
+        )
+    
     def extract_features(self, text: str, entity_counts: Dict[str, int], 
-                        sensitive_keywords: int) -> Features:
+                        sensitive_keywords: int) -> FeaturesInternal:
         """
         Extract features from text for ML model
         
@@ -61,13 +193,13 @@ class MLService:
             sensitive_keywords: Count of sensitive keywords
             
         Returns:
-            Features object
+            FeaturesInternal object
         """
         text_length = len(text)
         total_entities = sum(entity_counts.values())
         entity_density = total_entities / text_length if text_length > 0 else 0
         
-        return Features(
+        return FeaturesInternal(
             num_emails=entity_counts.get("num_emails", 0),
             num_phones=entity_counts.get("num_phones", 0),
             num_locations=entity_counts.get("num_locations", 0),
@@ -79,7 +211,7 @@ class MLService:
             sensitive_keywords_count=sensitive_keywords
         )
     
-    def calculate_risk_score(self, features: Features) -> RiskScore:
+    def calculate_risk_score(self, features: FeaturesInternal) -> RiskScore:
         """
         Calculate risk score from features
         
@@ -96,42 +228,19 @@ class MLService:
             # Use rule-based scoring
             return self._rule_based_scoring(features)
     
-    def _rule_based_scoring(self, features: Features) -> RiskScore:
+    def _rule_based_scoring(self, features: FeaturesInternal) -> RiskScore:
         """
         Rule-based risk scoring (baseline)
         
         Uses weighted feature importance
         """
-        weights = settings.FEATURE_WEIGHTS
-        
-        # Normalize features
-        normalized_features = {
-            "num_emails": min(features.num_emails / 3, 1.0),
-            "num_phones": min(features.num_phones / 2, 1.0),
-            "num_locations": min(features.num_locations / 5, 1.0),
-            "num_persons": min(features.num_persons / 3, 1.0),
-            "num_organizations": min(features.num_organizations / 3, 1.0),
-            "text_length": min(features.text_length / 1000, 1.0),
-            "entity_density": min(features.entity_density * 100, 1.0),
-            "sensitive_keywords": min(features.sensitive_keywords_count / 5, 1.0)
-        }
-        
-        # Calculate weighted score
-        score = 0.0
-        for feature, value in normalized_features.items():
-            weight = weights.get(feature, 0.1)
-            score += value * weight
+        score, level_idx = self._rb(features)
         
         # Convert to 0-100 scale
         score_100 = min(score * 100, 100)
         
         # Determine risk level
-        if score < settings.RISK_LOW_THRESHOLD:
-            level = RiskLevel.LOW
-        elif score < settings.RISK_MEDIUM_THRESHOLD:
-            level = RiskLevel.MEDIUM
-        else:
-            level = RiskLevel.HIGH
+        level = _RISK_LEVEL_BY_IDX[level_idx]
         
         return RiskScore(
             score=round(score_100, 2),
@@ -140,7 +249,7 @@ class MLService:
             confidence=0.75  # Rule-based has moderate confidence
         )
     
-    def _ml_based_scoring(self, features: Features) -> RiskScore:
+    def _ml_based_scoring(self, features: FeaturesInternal) -> RiskScore:
         """
         ML model-based risk scoring (advanced)
         
@@ -168,14 +277,13 @@ class MLService:
         probabilities = self.model.predict_proba(feature_array)[0]
         
         # Map prediction to risk level
-        risk_levels = [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH]
-        level = risk_levels[prediction]
+        level = _RISK_LEVEL_BY_IDX[prediction]
         
         # Get probability of predicted class
         ml_probability = probabilities[prediction]
         
         # Calculate overall score (weighted average of probabilities)
-        score_100 = (probabilities[0] * 25 + probabilities[1] * 60 + probabilities[2] * 100)
+        score_100 = float(probabilities @ _PROB_WEIGHTS)
         
         return RiskScore(
             score=round(score_100, 2),
@@ -196,5 +304,7 @@ class MLService:
         return settings.FEATURE_WEIGHTS
 
 
-# Global ML service instance
-ml_service = MLService()
+@cache
+def get_ml_service() -> MLService:
+    """Return the shared ML service, loading the model on first use"""
+    return MLService()
@@ -1,5 +1,5 @@
 """NLP module for PII detection"""
 
-from .pii_detector import nlp_service
+from .pii_detector import get_nlp_service
 
-__all__ = ["nlp_service"]
+__all__ = ["get_nlp_service"]
@@ -3,13 +3,55 @@ NLP Service - PII Detection using spaCy and Presidio
 """
 
 import spacy
+from bisect import bisect_left
+from collections import Counter
+from functools import cache
 from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
 from presidio_analyzer.nlp_engine import NlpEngineProvider
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.models.schemas import PIIEntity
 from app.core.config import settings
 
 
+# Entity type (upper-cased) -> feature counter; anything else is num_other
+_TYPE_TO_COUNTER = {
+    "EMAIL": "num_emails",
+    "EMAIL_ADDRESS": "num_emails",
+    "PHONE": "num_phones",
+    "PHONE_NUMBER": "num_phones",
+    "LOCATION": "num_locations",
+    "GPE": "num_locations",
+    "LOC": "num_locations",
+    "PERSON": "num_persons",
+    "ORGANIZATION": "num_organizations",
+    "ORG": "num_organizations",
+    "DATE": "num_dates",
+}
+_ENTITY_COUNTERS = (
+    "num_emails", "num_phones", "num_locations", "num_persons",
+    "num_organizations", "num_dates", "num_other"
+)
+
+# detect_pii only reads doc.ents, so skip the components NER doesn't need
+_UNUSED_SPACY_COMPONENTS = ["parser", "lemmatizer", "tagger", "attribute_ruler"]
+
+
+def _insert_position(starts: List[int], ends: List[int], start: int, end: int) -> int:
+    """
+    Find where a span goes in the position-sorted entity list
+    
+    Returns -1 if the exact span is already present; otherwise the index
+    after any entities with the same start, keeping detection order.
+    """
+    i = bisect_left(starts, start)
+    n = len(starts)
+    while i < n and starts[i] == start:
+        if ends[i] == end:
+            return -1
+        i += 1
+    return i
+
+
 class NLPService:
     """NLP service for PII detection"""
     
@@ -22,14 +64,14 @@ class NLPService:
         """Initialize spaCy and Presidio"""
         try:
             # Load spaCy model
-            self.nlp = spacy.load(settings.SPACY_MODEL)
+            self.nlp = spacy.load(settings.SPACY_MODEL, disable=_UNUSED_SPACY_COMPONENTS)
             print(f"✅ Loaded spaCy model: {settings.SPACY_MODEL}")
         except OSError:
             print(f"⚠️  spaCy model not found. Download it with:")
             print(f"   python -m spacy download {settings.SPACY_MODEL}")
             # Fallback to smaller model
             try:
-                self.nlp = spacy.load("en_core_web_sm")
+                self.nlp = spacy.load("en_core_web_sm", disable=_UNUSED_SPACY_COMPONENTS)
                 print("✅ Loaded fallback model: en_core_web_sm")
             except:
                 print("❌ No spaCy model available. Install with:")
@@ -37,6 +79,8 @@ class NLPService:
                 self.nlp = None
         
         # Initialize Presidio Analyzer
+        # Presidio keeps its own full pipeline: its context enhancer relies on
+        # token lemmas, which the stripped pipeline above no longer produces
         try:
             configuration = {
                 "nlp_engine_name": "spacy",
@@ -63,7 +107,8 @@ class NLPService:
             List of detected PII entities
         """
         entities = []
-        seen_spans = set()  # To avoid duplicates
+        starts = []  # Parallel to entities, kept sorted for bisect
+        ends = []
         
         # Method 1: Presidio Analysis (primary)
         if self.analyzer:
@@ -74,34 +119,35 @@ class NLPService:
             )
             
             for result in results:
-                span = (result.start, result.end)
-                if span not in seen_spans:
-                    entities.append(PIIEntity(
+                i = _insert_position(starts, ends, result.start, result.end)
+                if i >= 0:
+                    entities.insert(i, PIIEntity(
                         type=result.entity_type,
                         text=text[result.start:result.end],
                         start=result.start,
                         end=result.end,
                         confidence=result.score
                     ))
-                    seen_spans.add(span)
+                    starts.insert(i, result.start)
+                    ends.insert(i, result.end)
         
         # Method 2: spaCy NER (supplementary)
         if self.nlp:
             doc = self.nlp(text)
             for ent in doc.ents:
-                span = (ent.start_char, ent.end_char)
-                if span not in seen_spans and ent.label_ in ["PERSON", "GPE", "LOC", "ORG", "DATE"]:
-                    entities.append(PIIEntity(
+                if ent.label_ not in ["PERSON", "GPE", "LOC", "ORG", "DATE"]:
+                    continue
+                i = _insert_position(starts, ends, ent.start_char, ent.end_char)
+                if i >= 0:
+                    entities.insert(i, PIIEntity(
                         type=ent.label_,
                         text=ent.text,
                         start=ent.start_char,
                         end=ent.end_char,
                         confidence=0.85  # Default confidence for spaCy
                     ))
-                    seen_spans.add(span)
-        
-        # Sort by position
-        entities.sort(key=lambda x: x.start)
+                    starts.insert(i, ent.start_char)
+                    ends.insert(i, ent.end_char)
         
         return entities
     
@@ -115,50 +161,31 @@ class NLPService:
         Returns:
             Dictionary with entity counts
         """
-        counts = {
-            "num_emails": 0,
-            "num_phones": 0,
-            "num_locations": 0,
-            "num_persons": 0,
-            "num_organizations": 0,
-            "num_dates": 0,
-            "num_other": 0
-        }
-        
-        for entity in entities:
-            entity_type = entity.type.upper()
-            
-            if "EMAIL" in entity_type:
-                counts["num_emails"] += 1
-            elif "PHONE" in entity_type:
-                counts["num_phones"] += 1
-            elif entity_type in ["LOCATION", "GPE", "LOC"]:
-                counts["num_locations"] += 1
-            elif entity_type == "PERSON":
-                counts["num_persons"] += 1
-            elif entity_type in ["ORGANIZATION", "ORG"]:
-                counts["num_organizations"] += 1
-            elif entity_type == "DATE":
-                counts["num_dates"] += 1
-            else:
-                counts["num_other"] += 1
+        counts = dict.fromkeys(_ENTITY_COUNTERS, 0)
+        counts.update(Counter(
+            _TYPE_TO_COUNTER.get(entity.type.upper(), "num_other") for entity in entities
+        ))
         
         return counts
     
-    def detect_sensitive_keywords(self, text: str) -> int:
+    def detect_sensitive_keywords(self, text: str, text_lower: Optional[str] = None) -> int:
         """
         Count sensitive keywords in text
         
         Args:
             text: Input text
+            text_lower: Pre-lowercased text, if the caller already has it
             
         Returns:
             Count of sensitive keywords found
         """
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         count = sum(1 for keyword in settings.SENSITIVE_KEYWORDS if keyword in text_lower)
         return count
 
 
-# Global NLP service instance
-nlp_service = NLPService()
+@cache
+def get_nlp_service() -> NLPService:
+    """Return the shared NLP service, loading spaCy/Presidio on first use"""
+    return NLPService()
@@ -2,11 +2,206 @@
 Web Scraping Service
 """
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, UnicodeDammit
+from concurrent.futures import ThreadPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
+import logging
 import re
+from bisect import bisect_right
+from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+logger = logging.getLogger(__name__)
+
+try:  # requests-cache is optional; without it every scan hits the network
+    from requests_cache import CachedSession
+except ImportError:  # pragma: no cover - depends on installed extras
+    CachedSession = None
+
+try:  # orjson is optional; fall back to requests' stdlib-based .json()
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+try:  # lxml is the fast C parser; fall back to the stdlib one if it's missing
+    from lxml import etree, html as lxml_html
+    _HTML_PARSER = 'lxml'
+except ImportError:  # pragma: no cover - depends on installed extras
+    etree = lxml_html = None
+    _HTML_PARSER = 'html.parser'
+
+# Upper bound on HTML downloaded per page; anything past it is dropped
+_MAX_HTML_BYTES = 2_000_000
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Plausible size range for a public LinkedIn profile page; smaller bodies
+# are login walls/interstitials, larger ones aren't profiles
+_MIN_PROFILE_BYTES = 5_000
+_MAX_PROFILE_BYTES = 5_000_000
+
+# Concurrent GitHub API requests per scan (kept low for rate limits)
+_GITHUB_MAX_WORKERS = 8
+
+# Repository root files that should never be public
+_SENSITIVE_FILES = frozenset({
+    '.env', '.env.local', 'config.json', 'credentials.json', 'secrets.yaml', 'id_rsa'
+})
+
+# LinkedIn profile fields located via case-insensitive class-substring selectors
+_SEL_NAME = 'h1[class*="top-card" i][class*="name" i], h1[class*="profile" i][class*="name" i]'
+_SEL_HEADLINE = '[class*="headline" i], [class*="top-card" i][class*="occupation" i]'
+_SEL_LOCATION = '[class*="location" i], [class*="geo" i]'
+_SEL_ABOUT = '[class*="about" i][class*="section" i], [class*="summary" i]'
+_SEL_PROFILE_IMG = 'img[class*="profile" i][class*="photo" i], img[class*="avatar" i]'
+_SEL_PROFILE_FIELDS = ', '.join(
+    (_SEL_NAME, _SEL_HEADLINE, _SEL_LOCATION, _SEL_ABOUT, _SEL_PROFILE_IMG, 'h1')
+)
+
+# Slot name -> predicate on (tag, lowercased class attribute), mirroring the
+# selectors above; the first element in document order wins each slot
+_PROFILE_SLOTS = (
+    ('name', lambda tag, cls: tag == 'h1' and 'name' in cls and ('top-card' in cls or 'profile' in cls)),
+    ('h1', lambda tag, cls: tag == 'h1'),
+    ('headline', lambda tag, cls: 'headline' in cls or ('top-card' in cls and 'occupation' in cls)),
+    ('location', lambda tag, cls: 'location' in cls or 'geo' in cls),
+    ('about', lambda tag, cls: ('about' in cls and 'section' in cls) or 'summary' in cls),
+    ('img', lambda tag, cls: tag == 'img' and (('profile' in cls and 'photo' in cls) or 'avatar' in cls)),
+)
+
+# PII patterns checked in LinkedIn About sections, combined into one
+# alternation so the text is scanned once; the group name is the PII type
+_RE_PII = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<phone>\b(?:\+?\d{1,3}[-.\s]?)?\(?(?P<area>\d{3})\)?[-.\s]?(?P<exch>\d{3})[-.\s]?(?P<line>\d{4})\b)'
+    r'|(?P<address>\b\d+\s+[\w\s]+?(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct)\b)',
+    re.I
+)
+
+# Privacy score cut-offs; a score at or above a cut-off takes the next level
+_RISK_THRESHOLDS = (40, 70)
+_RISK_LEVELS = ('LOW RISK', 'MEDIUM RISK', 'HIGH RISK')
+
+# Commit author emails that GitHub generates and that expose nothing
+_IGNORED_EMAIL_SUFFIXES = ('@users.noreply.github.com', '@noreply.github.com')
+
+# Well-known dummy numbers that show up in bios and templates
+_PLACEHOLDER_PHONES = frozenset({'5551234567', '1234567890', '0000000000'})
+
+# Secret patterns checked in GitHub READMEs
+_RE_AWS = re.compile(r'AKIA[0-9A-Z]{16}', re.I)
+_RE_OPENAI = re.compile(r'sk-[a-zA-Z0-9]{48}', re.I)
+_RE_GH_TOKEN = re.compile(r'ghp_[a-zA-Z0-9]{36}', re.I)
+_RE_API_KEY = re.compile(r'api[_-]?key["\']?\s*[:=]\s*["\']([a-zA-Z0-9_-]{32,})', re.I)
+# (name, literal every match must contain, pattern); the literal is a cheap
+# lowercase substring gate so clean READMEs never reach the regex engine
+_SECRET_PATTERNS = (
+    ('aws_key', 'akia', _RE_AWS),
+    ('openai_key', 'sk-', _RE_OPENAI),
+    ('github_token', 'ghp_', _RE_GH_TOKEN),
+    ('api_key', 'api', _RE_API_KEY),
+)
+
+@dataclass(slots=True)
+class LinkedInProfile:
+    """Scraped LinkedIn profile; converted to a dict only when returned"""
+    url: str
+    name: Optional[str] = None
+    headline: Optional[str] = None
+    about: Optional[str] = None
+    location: Optional[str] = None
+    profile_picture_url: Optional[str] = None
+    experience: List[Dict] = field(default_factory=list)
+    education: List[Dict] = field(default_factory=list)
+    contact_info: Dict = field(default_factory=dict)
+    exposed_pii: List[Dict] = field(default_factory=list)
+    privacy_issues: List[Dict] = field(default_factory=list)
+    public_visibility: Dict[str, bool] = field(default_factory=dict)
+    privacy_score: Dict = field(default_factory=dict)
+    recommendations: List[str] = field(default_factory=list)
+
+
+def _make_session(headers: Dict[str, str], cache_name: Optional[str] = None,
+                  expire_after: int = 0) -> requests.Session:
+    """
+    Create a keep-alive session with pooled connections and retries
+    
+    If cache_name is given and requests-cache is installed, responses are
+    cached in a SQLite file of that name for expire_after seconds.
+    """
+    if cache_name and CachedSession is not None:
+        session = CachedSession(cache_name, backend='sqlite', expire_after=expire_after)
+    else:
+        session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+def _parse_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it's available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _read_html(response: requests.Response) -> bytes:
+    """Read a streamed HTML response body, capped at _MAX_HTML_BYTES"""
+    try:
+        content_type = response.headers.get('content-type', '')
+        if not content_type.startswith(_HTML_CONTENT_TYPES):
+            raise ValueError(f"Expected an HTML page but got '{content_type or 'unknown'}' content")
+        
+        buf = bytearray()
+        for chunk in response.iter_content(64 * 1024):
+            buf.extend(chunk)
+            if len(buf) >= _MAX_HTML_BYTES:
+                del buf[_MAX_HTML_BYTES:]
+                break
+        return bytes(buf)
+    finally:
+        response.close()
+
+
+def _declared_charset(response: requests.Response) -> Optional[str]:
+    """Return the charset named in the Content-Type header, if there is one"""
+    if 'charset' not in response.headers.get('content-type', '').lower():
+        return None  # get_encoding_from_headers would guess ISO-8859-1 here
+    return requests.utils.get_encoding_from_headers(response.headers)
+
+
+def _extract_text(content: bytes, encoding: Optional[str] = None) -> str:
+    """
+    Return the text of an HTML document, skipping script and style bodies.
+    
+    lxml reads bytes without a <meta charset> as Latin-1, so when the server
+    didn't declare an encoding it is detected the way BeautifulSoup does it.
+    """
+    if encoding is None:
+        encoding = UnicodeDammit(content, is_html=True).original_encoding
+    
+    if lxml_html is not None:
+        try:
+            parser = lxml_html.HTMLParser(encoding=encoding)
+            tree = lxml_html.fromstring(content, parser=parser)
+            etree.strip_elements(tree, 'script', 'style', with_tail=False)
+            return tree.text_content()
+        except (etree.ParserError, LookupError, ValueError):
+            pass  # Empty or malformed document; let BeautifulSoup have a go
+    
+    soup = BeautifulSoup(content, _HTML_PARSER, from_encoding=encoding)
+    for script_or_style in soup(["script", "style"]):
+        script_or_style.decompose()
+    return soup.get_text()
+
+
 def scrape_text_from_url(url: str) -> str:
     """
     Scrapes the text content from a given URL.
@@ -18,17 +213,11 @@ def scrape_text_from_url(url: str) -> str:
         The extracted text content from the URL.
     """
     try:
-        response = requests.get(url, timeout=10)
+        response = requests.get(url, timeout=10, stream=True)
         response.raise_for_status()  # Raise an exception for bad status codes
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        # Remove script and style elements
-        for script_or_style in soup(["script", "style"]):
-            script_or_style.decompose()
-
         # Get text
-        text = soup.get_text()
+        text = _extract_text(_read_html(response), _declared_charset(response))
 
         # Break into lines and remove leading/trailing space on each
         lines = (line.strip() for line in text.splitlines())
@@ -57,11 +246,11 @@ def scrape_linkedin_profile(profile_url: str) -> Dict:
     Returns:
         Dictionary containing profile information and detected privacy risks
     """
+    # Validate LinkedIn URL
+    if not _is_linkedin_profile_url(profile_url):
+        raise ValueError("Invalid LinkedIn URL. Must be a linkedin.com profile link.")
+    
     try:
-        # Validate LinkedIn URL
-        if 'linkedin.com' not in profile_url:
-            raise ValueError("Invalid LinkedIn URL. Must be a linkedin.com profile link.")
-        
         # Use headers to mimic a browser request
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -70,94 +259,86 @@ def scrape_linkedin_profile(profile_url: str) -> Dict:
             'Connection': 'keep-alive',
         }
         
-        response = requests.get(profile_url, headers=headers, timeout=15)
-        response.raise_for_status()
+        # Not cached: requests-cache would read the whole body to store it,
+        # bypassing the streamed size cap in _read_html
+        with _make_session(headers) as session:
+            _check_linkedin_head(session, profile_url)
+            response = session.get(profile_url, timeout=15, stream=True)
+            response.raise_for_status()
+            html = _read_html(response)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = LexborHTMLParser(html)
         
         # Extract profile data
-        profile_data = {
-            'url': profile_url,
-            'name': None,
-            'headline': None,
-            'about': None,
-            'location': None,
-            'profile_picture_url': None,
-            'experience': [],
-            'education': [],
-            'contact_info': {},
-            'exposed_pii': [],
-            'privacy_issues': [],
-            'public_visibility': {}
-        }
+        profile = LinkedInProfile(url=profile_url)
+        
+        # Locate every profile field in a single traversal
+        slots = {}
+        for node in tree.css(_SEL_PROFILE_FIELDS):
+            cls = (node.attributes.get('class') or '').lower()
+            for slot, matches in _PROFILE_SLOTS:
+                if slot not in slots and matches(node.tag, cls):
+                    slots[slot] = node
         
         # Extract name
-        name_elem = soup.find('h1', class_=re.compile('.*top-card.*name.*|.*profile.*name.*', re.I))
-        if not name_elem:
-            name_elem = soup.find('h1')
+        name_elem = slots.get('name') or slots.get('h1')
         if name_elem:
-            profile_data['name'] = name_elem.get_text(strip=True)
-            profile_data['public_visibility']['name'] = True
+            profile.name = name_elem.text(strip=True)
+            profile.public_visibility['name'] = True
         
         # Extract headline
-        headline_elem = soup.find(class_=re.compile('.*headline.*|.*top-card.*occupation.*', re.I))
+        headline_elem = slots.get('headline')
         if headline_elem:
-            profile_data['headline'] = headline_elem.get_text(strip=True)
-            profile_data['public_visibility']['headline'] = True
+            profile.headline = headline_elem.text(strip=True)
+            profile.public_visibility['headline'] = True
         
         # Extract location
-        location_elem = soup.find(class_=re.compile('.*location.*|.*geo.*', re.I))
+        location_elem = slots.get('location')
         if location_elem:
-            profile_data['location'] = location_elem.get_text(strip=True)
-            profile_data['public_visibility']['location'] = True
-            profile_data['privacy_issues'].append({
+            profile.location = location_elem.text(strip=True)
+            profile.public_visibility['location'] = True
+            profile.privacy_issues.append({
                 'type': 'location_exposed',
                 'severity': 'medium',
-                'message': f"Your location '{profile_data['location']}' is publicly visible"
+                'message': f"Your location '{profile.location}' is publicly visible"
             })
         
         # Extract about section
-        about_elem = soup.find(class_=re.compile('.*about.*section.*|.*summary.*', re.I))
+        about_elem = slots.get('about')
         if about_elem:
-            about_text = about_elem.get_text(strip=True)
-            profile_data['about'] = about_text
-            profile_data['public_visibility']['about'] = True
+            about_text = about_elem.text(strip=True)
+            profile.about = about_text
+            profile.public_visibility['about'] = True
             
             # Check for PII in about section
-            pii_patterns = {
-                'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-                'phone': r'\b(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
-                'address': r'\b\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct)\b'
-            }
-            
-            for pii_type, pattern in pii_patterns.items():
-                matches = re.findall(pattern, about_text, re.I)
-                if matches:
-                    for match in matches:
-                        profile_data['exposed_pii'].append({
-                            'type': pii_type,
-                            'value': match if isinstance(match, str) else match[0],
-                            'location': 'About section'
-                        })
-                        profile_data['privacy_issues'].append({
-                            'type': f'{pii_type}_in_about',
-                            'severity': 'high' if pii_type in ['email', 'phone'] else 'medium',
-                            'message': f"{pii_type.capitalize()} found in About section - should be kept private"
-                        })
+            for match in _RE_PII.finditer(about_text):
+                pii_type = match.lastgroup
+                if pii_type == 'phone' and not _valid_nanp(match['area'], match['exch'], match['line']):
+                    continue
+                profile.exposed_pii.append({
+                    'type': pii_type,
+                    'value': match.group(pii_type),
+                    'location': 'About section'
+                })
+                profile.privacy_issues.append({
+                    'type': f'{pii_type}_in_about',
+                    'severity': 'high' if pii_type in ['email', 'phone'] else 'medium',
+                    'message': f"{pii_type.capitalize()} found in About section - should be kept private"
+                })
         
         # Check if profile picture is visible
-        img_elem = soup.find('img', class_=re.compile('.*profile.*photo.*|.*avatar.*', re.I))
-        if img_elem and img_elem.get('src'):
-            profile_data['profile_picture_url'] = img_elem['src']
-            profile_data['public_visibility']['profile_picture'] = True
+        img_elem = slots.get('img')
+        if img_elem and img_elem.attributes.get('src'):
+            profile.profile_picture_url = img_elem.attributes['src']
+            profile.public_visibility['profile_picture'] = True
         
         # Analyze overall privacy risk
-        profile_data['privacy_score'] = _calculate_linkedin_privacy_score(profile_data)
+        profile.privacy_score = _calculate_linkedin_privacy_score(profile)
         
         # Generate recommendations
-        profile_data['recommendations'] = _generate_linkedin_recommendations(profile_data)
+        profile.recommendations = _generate_linkedin_recommendations(profile)
         
-        return profile_data
+        return asdict(profile)
         
     except requests.exceptions.RequestException as e:
         print(f"Error fetching LinkedIn profile {profile_url}: {e}")
@@ -167,27 +348,75 @@ def scrape_linkedin_profile(profile_url: str) -> Dict:
         raise ValueError(f"Could not parse LinkedIn profile data: {e}")
 
 
-def _calculate_linkedin_privacy_score(profile_data: Dict) -> Dict:
+def _is_linkedin_profile_url(profile_url: str) -> bool:
+    """Checks the parsed host and path, so 'evil.com/linkedin.com/in/x' is rejected"""
+    parsed = urlparse(profile_url)
+    netloc = (parsed.hostname or '').lower()
+    return (
+        parsed.scheme in ('http', 'https')
+        and (netloc == 'linkedin.com' or netloc.endswith('.linkedin.com'))
+        and '/in/' in parsed.path
+    )
+
+
+def _check_linkedin_head(session: requests.Session, profile_url: str) -> None:
+    """
+    Fail fast on responses that can't be a public profile, before downloading
+    
+    Servers that don't support HEAD, or omit the headers, are let through to
+    the full GET.
+    """
+    head = session.head(profile_url, timeout=5, allow_redirects=True)
+    if head.status_code in (405, 501):
+        return
+    head.raise_for_status()
+    # LinkedIn answers bots with a non-standard 999, which raise_for_status() lets through
+    if not 200 <= head.status_code < 300:
+        raise requests.exceptions.HTTPError(
+            f"LinkedIn returned HTTP {head.status_code} for the profile", response=head
+        )
+    
+    content_type = head.headers.get('content-type')
+    if content_type and not content_type.startswith(_HTML_CONTENT_TYPES):
+        raise ValueError(f"Expected an HTML page but got '{content_type}' content")
+    
+    content_length = head.headers.get('content-length')
+    if content_length and content_length.isdigit():
+        size = int(content_length)
+        if size < _MIN_PROFILE_BYTES:
+            raise ValueError("LinkedIn returned a login or interstitial page instead of the public profile")
+        if size > _MAX_PROFILE_BYTES:
+            raise ValueError("Response is too large to be a LinkedIn profile page")
+
+
+def _valid_nanp(area: str, exch: str, line: str) -> bool:
+    """Check a phone match against NANP numbering rules and known placeholders"""
+    if area[0] in '01' or exch[0] in '01':
+        return False
+    return (area + exch + line) not in _PLACEHOLDER_PHONES
+
+
+def _calculate_linkedin_privacy_score(profile: LinkedInProfile) -> Dict:
     """Calculate privacy risk score for LinkedIn profile"""
     risk_score = 0
     max_score = 100
     
     # Exposed PII (40 points)
-    pii_count = len(profile_data['exposed_pii'])
+    pii_count = len(profile.exposed_pii)
     if pii_count > 0:
         risk_score += min(40, pii_count * 15)
     
     # Public visibility (30 points)
-    visible_fields = sum(1 for v in profile_data['public_visibility'].values() if v)
+    visible_fields = sum(1 for v in profile.public_visibility.values() if v)
     risk_score += min(30, visible_fields * 5)
     
     # Location exposed (15 points)
-    if profile_data.get('location'):
+    if profile.location:
         risk_score += 15
     
     # About section length (15 points - more info = more risk)
-    if profile_data.get('about'):
-        about_length = len(profile_data['about'])
+    if profile.about:
+        about_length = len(profile.about)
         if about_length > 500:
             risk_score += 15
         elif about_length > 200:
@@ -196,12 +425,7 @@ def _calculate_linkedin_privacy_score(profile_data: Dict) -> Dict:
             risk_score += 5
     
     # Determine risk level
-    if risk_score >= 70:
-        risk_level = "HIGH RISK"
-    elif risk_score >= 40:
-        risk_level = "MEDIUM RISK"
-    else:
-        risk_level = "LOW RISK"
+    risk_level = _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, risk_score)]
     
     return {
         'score': min(risk_score, max_score),
@@ -210,22 +434,22 @@ def _calculate_linkedin_privacy_score(profile_data: Dict) -> Dict:
     }
 
 
-def _generate_linkedin_recommendations(profile_data: Dict) -> List[str]:
+def _generate_linkedin_recommendations(profile: LinkedInProfile) -> List[str]:
     """Generate privacy recommendations for LinkedIn profile"""
     recommendations = []
     
-    if profile_data['exposed_pii']:
+    if profile.exposed_pii:
         recommendations.append("🔴 URGENT: Remove personal contact information (email/phone) from your About section")
         recommendations.append("Use LinkedIn's messaging system instead of exposing direct contact details")
     
-    if profile_data.get('location'):
+    if profile.location:
         recommendations.append("⚠️ Consider making your location more general (e.g., 'San Francisco Bay Area' instead of exact city)")
     
-    if len(profile_data['public_visibility']) > 3:
+    if len(profile.public_visibility) > 3:
         recommendations.append("Review your LinkedIn privacy settings to limit public visibility")
         recommendations.append("Go to Settings & Privacy → Visibility → Edit your public profile")
     
-    if profile_data.get('about') and len(profile_data['about']) > 500:
+    if profile.about and len(profile.about) > 500:
         recommendations.append("Your About section is very detailed - review for sensitive information")
     
     if not recommendations:
@@ -268,131 +492,138 @@ def scan_github_profile(username: str, github_token: Optional[str] = None) -> Di
             'recommendations': []
         }
         
-        # Get profile info
-        profile_response = requests.get(f'{base_url}/users/{username}', headers=headers, timeout=10)
-        profile_response.raise_for_status()
-        profile_data = profile_response.json()
-        
-        result['profile'] = {
-            'name': profile_data.get('name'),
-            'bio': profile_data.get('bio'),
-            'location': profile_data.get('location'),
-            'email': profile_data.get('email'),
-            'company': profile_data.get('company'),
-            'blog': profile_data.get('blog'),
-            'twitter_username': profile_data.get('twitter_username'),
-            'public_repos': profile_data.get('public_repos', 0),
-            'followers': profile_data.get('followers', 0),
-            'created_at': profile_data.get('created_at'),
-        }
-        
-        # Check profile for exposed PII
-        if result['profile']['email']:
-            result['privacy_issues'].append({
-                'type': 'email_in_profile',
-                'severity': 'high',
-                'message': f"Email '{result['profile']['email']}' is publicly visible in profile",
-                'location': 'Profile'
-            })
-        
-        if result['profile']['location']:
-            result['privacy_issues'].append({
-                'type': 'location_exposed',
-                'severity': 'medium',
-                'message': f"Location '{result['profile']['location']}' is public",
-                'location': 'Profile'
-            })
-        
-        # Get public repositories
-        repos_response = requests.get(
-            f'{base_url}/users/{username}/repos',
-            headers=headers,
-            params={'per_page': 30, 'sort': 'updated'},
-            timeout=10
-        )
-        repos_response.raise_for_status()
-        repos = repos_response.json()
-        
-        # Scan repositories for secrets (limit to first 5 for performance)
-        secret_patterns = {
-            'aws_key': r'AKIA[0-9A-Z]{16}',
-            'openai_key': r'sk-[a-zA-Z0-9]{48}',
-            'github_token': r'ghp_[a-zA-Z0-9]{36}',
-            'api_key': r'api[_-]?key["\']?\s*[:=]\s*["\']([a-zA-Z0-9_-]{32,})',
-        }
-        
-        for repo in repos[:5]:  # Limit to 5 repos for faster scanning
-            repo_info = {
-                'name': repo['name'],
-                'description': repo.get('description'),
-                'private': repo.get('private', False),
-                'has_issues': len(result['exposed_secrets']) > 0
+        with _make_session(headers, 'github_cache', expire_after=900) as session:
+            # Get profile info
+            profile_response = session.get(f'{base_url}/users/{username}', timeout=10)
+            profile_response.raise_for_status()
+            profile_data = _parse_json(profile_response)
+            
+            result['profile'] = {
+                'name': profile_data.get('name'),
+                'bio': profile_data.get('bio'),
+                'location': profile_data.get('location'),
+                'email': profile_data.get('email'),
+                'company': profile_data.get('company'),
+                'blog': profile_data.get('blog'),
+                'twitter_username': profile_data.get('twitter_username'),
+                'public_repos': profile_data.get('public_repos', 0),
+                'followers': profile_data.get('followers', 0),
+                'created_at': profile_data.get('created_at'),
             }
-            result['repositories'].append(repo_info)
             
-            # Search for common sensitive files (reduced for speed)
-            sensitive_files = ['.env', 'config.json']
+            # Check profile for exposed PII
+            if result['profile']['email']:
+                result['privacy_issues'].append({
+                    'type': 'email_in_profile',
+                    'severity': 'high',
+                    'message': f"Email '{result['profile']['email']}' is publicly visible in profile",
+                    'location': 'Profile'
+                })
+            
+            if result['profile']['location']:
+                result['privacy_issues'].append({
+                    'type': 'location_exposed',
+                    'severity': 'medium',
+                    'message': f"Location '{result['profile']['location']}' is public",
+                    'location': 'Profile'
+                })
             
-            for filename in sensitive_files:
-                try:
-                    file_response = requests.get(
-                        f"{base_url}/repos/{username}/{repo['name']}/contents/{filename}",
-                        headers=headers,
-                        timeout=3
-                    )
-                    if file_response.status_code == 200:
-                        result['exposed_secrets'].append({
-                            'type': 'sensitive_file',
-                            'file': filename,
-                            'repo': repo['name'],
-                            'severity': 'critical',
-                            'message': f"Sensitive file '{filename}' found in public repo"
-                        })
-                except:
-                    pass
+            # Get public repositories
+            repos_response = session.get(
+                f'{base_url}/users/{username}/repos',
+                params={'per_page': 30, 'sort': 'updated'},
+                timeout=10
+            )
+            repos_response.raise_for_status()
+            repos = _parse_json(repos_response)
             
-            # Get README content to scan for secrets (with shorter timeout)
-            try:
-                readme_response = requests.get(
+            # Scan repositories for secrets (limit to first 5 for performance)
+            # Build every per-repo request up front so they can run concurrently
+            probes = []  # (meta, url, request kwargs)
+            top_repos = repos[:5]  # Limit to 5 repos for faster scanning
+            for idx, repo in enumerate(top_repos):
+                result['repositories'].append({
+                    'name': repo['name'],
+                    'description': repo.get('description'),
+                    'private': repo.get('private', False),
+                    'has_issues': False
+                })
+            
+                # List the repo's root tree once to look for sensitive files
+                probes.append((
+                    {'kind': 'tree', 'repo': repo['name']},
+                    f"{base_url}/repos/{username}/{repo['name']}/git/trees/{repo.get('default_branch', 'HEAD')}",
+                    {'timeout': 3}
+                ))
+            
+                # Get README content to scan for secrets (with shorter timeout)
+                probes.append((
+                    {'kind': 'readme', 'repo': repo['name']},
                     f"{base_url}/repos/{username}/{repo['name']}/readme",
-                    headers={**headers, 'Accept': 'application/vnd.github.raw'},
-                    timeout=3
-                )
-                if readme_response.status_code == 200:
-                    readme_content = readme_response.text[:5000]  # Limit content size
-                    
-                    # Check for critical patterns only
-                    for pattern_name, pattern in secret_patterns.items():
-                        if pattern_name in ['aws_key', 'openai_key', 'github_token', 'api_key']:
-                            matches = re.findall(pattern, readme_content, re.I)
-                            if matches:
-                                result['exposed_secrets'].append({
-                                    'type': pattern_name,
-                                    'repo': repo['name'],
-                                    'file': 'README.md',
-                                    'severity': 'critical',
-                                    'message': f"Potential {pattern_name.replace('_', ' ')} found in README"
-                                })
-            except:
-                pass
+                    {'headers': {'Accept': 'application/vnd.github.raw'}, 'timeout': 3}
+                ))
             
-            # Get recent commits to extract emails (only for first 3 repos)
-            if repos.index(repo) < 3:  # Only check first 3 repos for speed
-                try:
-                    commits_response = requests.get(
+                # Get recent commits to extract emails (only for first 3 repos)
+                if idx < 3:  # Only check first 3 repos for speed
+                    probes.append((
+                        {'kind': 'commits', 'repo': repo['name']},
                         f"{base_url}/repos/{username}/{repo['name']}/commits",
-                        headers=headers,
-                        params={'per_page': 5},
-                        timeout=3
-                    )
-                    if commits_response.status_code == 200:
-                        commits = commits_response.json()
-                        for commit in commits[:5]:  # Limit commits checked
-                            author_email = commit.get('commit', {}).get('author', {}).get('email')
-                            if author_email and not author_email.endswith('@users.noreply.github.com'):
-                                result['commit_emails'].add(author_email)
-                except:
-                    pass
+                        {'params': {'per_page': 5}, 'timeout': 3}
+                    ))
+            
+            with ThreadPoolExecutor(max_workers=_GITHUB_MAX_WORKERS) as executor:
+                futures = [
+                    (meta, executor.submit(session.get, url, **kwargs))
+                    for meta, url, kwargs in probes
+                ]
+            
+                # Consume in submission order so results stay deterministic
+                for meta, future in futures:
+                    try:
+                        response = future.result()
+                        if response.status_code != 200:
+                            continue
+                    
+                        if meta['kind'] == 'tree':
+                            for entry in _parse_json(response).get('tree', []):
+                                filename = entry.get('path')
+                                if filename in _SENSITIVE_FILES:
+                                    result['exposed_secrets'].append({
+                                        'type': 'sensitive_file',
+                                        'file': filename,
+                                        'repo': meta['repo'],
+                                        'severity': 'critical',
+                                        'message': f"Sensitive file '{filename}' found in public repo"
+                                    })
+                    
+                        elif meta['kind'] == 'readme':
+                            readme_content = response.text[:5000]  # Limit content size
+                            readme_lower = readme_content.lower()
+                        
+                            # Check for critical patterns only
+                            for pattern_name, prefix, pattern in _SECRET_PATTERNS:
+                                if prefix in readme_lower and pattern.search(readme_content):
+                                    result['exposed_secrets'].append({
+                                        'type': pattern_name,
+                                        'repo': meta['repo'],
+                                        'file': 'README.md',
+                                        'severity': 'critical',
+                                        'message': f"Potential {pattern_name.replace('_', ' ')} found in README"
+                                    })
+                    
+                        elif meta['kind'] == 'commits':
+                            commits = _parse_json(response)
+                            for commit in commits[:5]:  # Limit commits checked
+                                author = (commit.get('commit') or {}).get('author') or {}
+                                author_email = (author.get('email') or '').lower()
+                                if author_email and not author_email.endswith(_IGNORED_EMAIL_SUFFIXES):
+                                    result['commit_emails'].add(author_email)
+                    except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                        logger.debug("Skipping %s for %s/%s: %s", meta['kind'], username, meta['repo'], e)
+        
+        repos_with_secrets = {secret['repo'] for secret in result['exposed_secrets']}
+        for repo_info in result['repositories']:
+            repo_info['has_issues'] = repo_info['name'] in repos_with_secrets
         
         # Convert set to list for JSON serialization
         result['commit_emails'] = list(result['commit_emails'])
@@ -451,12 +682,7 @@ def _calculate_github_privacy_score(data: Dict) -> Dict:
     risk_score += min(15, len(data['privacy_issues']) * 5)
     
     # Determine risk level
-    if risk_score >= 70:
-        risk_level = "HIGH RISK"
-    elif risk_score >= 40:
-        risk_level = "MEDIUM RISK"
-    else:
-        risk_level = "LOW RISK"
+    risk_level = _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, risk_score)]
     
     return {
         'score': min(risk_score, max_score),
@@ -9,59 +9,137 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
+from collections import OrderedDict
 from datetime import datetime
+from functools import cache
 from io import BytesIO
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+
+try:  # orjson is optional; fall back to the stdlib encoder for cache keys
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+# Stylesheet shared by every report, built once at import
+_STYLES = getSampleStyleSheet()
+
+# Title style
+_STYLES.add(ParagraphStyle(
+    name='CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#1e40af'),
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+))
+
+# Subtitle style
+_STYLES.add(ParagraphStyle(
+    name='CustomSubtitle',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    textColor=colors.HexColor('#3b82f6'),
+    spaceAfter=12,
+    spaceBefore=12,
+    fontName='Helvetica-Bold'
+))
+
+# Risk level style
+_STYLES.add(ParagraphStyle(
+    name='RiskLevel',
+    parent=_STYLES['Normal'],
+    fontSize=14,
+    alignment=TA_CENTER,
+    spaceAfter=20
+))
+
+# Body text
+_STYLES.add(ParagraphStyle(
+    name='CustomBody',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_JUSTIFY,
+    spaceAfter=10
+))
+
+# Table styles; the risk summary clones its base and adds the level colour
+_RISK_TABLE_STYLE_BASE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('FONTNAME', (1, 2), (1, 2), 'Helvetica-Bold'),
+    ('FONTSIZE', (1, 2), (1, 2), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f3f4f6')])
+])
+
+_PII_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
+])
+
+_FEATURES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
+])
+
+# Entities listed in the report, and rows per PII table; ReportLab's table
+# splitting gets superlinear on long tables, so larger lists are chunked
+_PII_TABLE_MAX_ENTITIES = 20
+_PII_TABLE_MAX_ROWS = 500
+
+# Fixed row heights (what ReportLab measures for these single-line cells),
+# so tables don't re-measure every cell during layout
+_HEADER_ROW_HEIGHT = 0.375*inch
+_BODY_ROW_HEIGHT = 0.25*inch
+
+_RISK_LEVEL_COLORS = {
+    'LOW': colors.HexColor('#22c55e'),
+    'MEDIUM': colors.HexColor('#eab308'),
+}
+_RISK_LEVEL_DEFAULT_COLOR = colors.HexColor('#ef4444')
+
+# Single-pass escaping for text placed inside Paragraph markup
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+
+def _row_heights(num_rows: int) -> List[float]:
+    """Row heights for a table with one header row"""
+    return [_HEADER_ROW_HEIGHT] + [_BODY_ROW_HEIGHT] * (num_rows - 1)
 
 
 class PDFReportGenerator:
     """Generate professional PDF reports for privacy analysis"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
-    
-    def _create_custom_styles(self):
-        """Create custom paragraph styles"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1e40af'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='CustomSubtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#3b82f6'),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Risk level style
-        self.styles.add(ParagraphStyle(
-            name='RiskLevel',
-            parent=self.styles['Normal'],
-            fontSize=14,
-            alignment=TA_CENTER,
-            spaceAfter=20
-        ))
-        
-        # Body text
-        self.styles.add(ParagraphStyle(
-            name='CustomBody',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            alignment=TA_JUSTIFY,
-            spaceAfter=10
-        ))
+        self.styles = _STYLES
     
     def generate_analysis_report(self, analysis_data: Dict[str, Any]) -> BytesIO:
         """
@@ -81,6 +159,7 @@ class PDFReportGenerator:
             leftMargin=72,
             topMargin=72,
             bottomMargin=18,
+            invariant=True,
         )
         
         # Container for the 'Flowable' objects
@@ -91,10 +170,15 @@ class PDFReportGenerator:
         elements.append(title)
         elements.append(Spacer(1, 0.2*inch))
         
-        # Add timestamp
-        timestamp = datetime.utcnow().strftime("%B %d, %Y at %H:%M UTC")
-        date_text = Paragraph(f"<i>Generated on {timestamp}</i>", self.styles['CustomBody'])
-        elements.append(date_text)
+        # Add timestamp; taken from the analysis (not the clock) so the same
+        # input always renders the same PDF and cached copies stay accurate
+        analyzed_at = analysis_data.get('timestamp')
+        if isinstance(analyzed_at, str):
+            analyzed_at = datetime.fromisoformat(analyzed_at)
+        if analyzed_at is not None:
+            timestamp = analyzed_at.strftime("%B %d, %Y at %H:%M UTC")
+            date_text = Paragraph(f"<i>Analyzed on {timestamp}</i>", self.styles['CustomBody'])
+            elements.append(date_text)
         elements.append(Spacer(1, 0.3*inch))
         
         # Risk Score Summary
@@ -117,7 +201,10 @@ class PDFReportGenerator:
         pii_entities = analysis_data.get('pii_entities', [])
         if pii_entities:
             elements.append(Paragraph("Detected Personal Information", self.styles['CustomSubtitle']))
-            elements.append(self._create_pii_table(pii_entities))
+            for i, table in enumerate(self._create_pii_tables(pii_entities)):
+                if i:
+                    elements.append(PageBreak())
+                elements.append(table)
             elements.append(Spacer(1, 0.3*inch))
         else:
             elements.append(Paragraph("Detected Personal Information", self.styles['CustomSubtitle']))
@@ -188,12 +275,7 @@ class PDFReportGenerator:
         confidence = risk_score.get('confidence', 0)
         
         # Determine color based on risk level
-        if level == 'LOW':
-            color = colors.HexColor('#22c55e')
-        elif level == 'MEDIUM':
-            color = colors.HexColor('#eab308')
-        else:
-            color = colors.HexColor('#ef4444')
+        color = _RISK_LEVEL_COLORS.get(level, _RISK_LEVEL_DEFAULT_COLOR)
         
         data = [
             ['Risk Assessment Summary'],
@@ -202,54 +284,49 @@ class PDFReportGenerator:
             ['Confidence', f'{confidence * 100:.0f}%' if confidence else 'N/A']
         ]
         
-        table = Table(data, colWidths=[2.5*inch, 2.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e40af')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('TEXTCOLOR', (1, 2), (1, 2), color),
-            ('FONTNAME', (1, 2), (1, 2), 'Helvetica-Bold'),
-            ('FONTSIZE', (1, 2), (1, 2), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f3f4f6')])
-        ]))
+        table = Table(data, colWidths=[2.5*inch, 2.5*inch], rowHeights=_row_heights(len(data)))
+        style = TableStyle(parent=_RISK_TABLE_STYLE_BASE)
+        style.add('TEXTCOLOR', (1, 2), (1, 2), color)
+        table.setStyle(style)
         
         return table
     
-    def _create_pii_table(self, pii_entities: List[Dict]) -> Table:
-        """Create table of detected PII"""
-        data = [['Type', 'Detected Text', 'Position']]
+    def _create_pii_tables(
+        self,
+        pii_entities: List[Dict],
+        max_rows: int = _PII_TABLE_MAX_ROWS
+    ) -> List[Table]:
+        """Create tables of detected PII, at most max_rows entities each"""
+        pii_entities = pii_entities[:_PII_TABLE_MAX_ENTITIES]
+        tables = []
         
-        for entity in pii_entities[:20]:  # Limit to 20 entities
-            entity_type = entity.get('type', 'Unknown')
-            text = entity.get('text', '')[:50]  # Limit text length
-            start = entity.get('start', 0)
-            end = entity.get('end', 0)
+        for offset in range(0, len(pii_entities), max_rows):
+            data = [['Type', 'Detected Text', 'Position']]
             
-            data.append([
-                entity_type,
-                self._escape_html(text),
-                f'{start}-{end}'
-            ])
-        
-        table = Table(data, colWidths=[1.5*inch, 2.5*inch, 1*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
-        ]))
+            for entity in pii_entities[offset:offset + max_rows]:
+                # Collapse newlines/tabs so every cell fits its fixed-height row
+                entity_type = ' '.join(str(entity.get('type', 'Unknown')).split())
+                text = ' '.join(entity.get('text', '').split())[:50]  # Limit text length
+                start = entity.get('start', 0)
+                end = entity.get('end', 0)
+                
+                data.append([
+                    entity_type,
+                    self._escape_html(text),
+                    f'{start}-{end}'
+                ])
+            
+            # Header row repeats if a table still splits across pages
+            table = Table(
+                data,
+                colWidths=[1.5*inch, 2.5*inch, 1*inch],
+                rowHeights=_row_heights(len(data)),
+                repeatRows=1
+            )
+            table.setStyle(_PII_TABLE_STYLE)
+            tables.append(table)
         
-        return table
+        return tables
     
     def _create_features_summary(self, features: Dict) -> Table:
         """Create features summary table"""
@@ -265,31 +342,58 @@ class PDFReportGenerator:
             ['Entity Density', f"{features.get('entity_density', 0):.2%}"]
         ]
         
-        table = Table(data, colWidths=[2.5*inch, 2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
-        ]))
+        table = Table(data, colWidths=[2.5*inch, 2*inch], rowHeights=_row_heights(len(data)))
+        table.setStyle(_FEATURES_TABLE_STYLE)
         
         return table
     
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters for PDF"""
-        if not text:
-            return ""
-        return (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#39;'))
+        return text.translate(_HTML_ESCAPE_TABLE) if text else ""
+
+
+@cache
+def get_pdf_generator() -> PDFReportGenerator:
+    """Return the shared PDF report generator"""
+    return PDFReportGenerator()
+
+
+def render_pdf_bytes(analysis_data: Dict[str, Any]) -> bytes:
+    """Render a report to bytes; top-level so it can run in a process pool"""
+    return get_pdf_generator().generate_analysis_report(analysis_data).getvalue()
+
+
+# Fields that end up in the rendered report; the id is left out of the cache
+# key so identical analyses made at the same time share one PDF
+_RENDERED_FIELDS = (
+    'risk_score', 'processing_time', 'pii_entities', 'features',
+    'recommendations', 'input_text', 'safe_rewrite', 'timestamp',
+)
+_PDF_CACHE_MAX_ENTRIES = 128
+_pdf_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def pdf_cache_key(analysis_data: Dict[str, Any]) -> str:
+    """Hash the rendered content of a report"""
+    content = {name: analysis_data.get(name) for name in _RENDERED_FIELDS}
+    if orjson is not None:
+        payload = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def get_cached_pdf(key: str) -> Optional[bytes]:
+    """Return a previously rendered PDF, marking it recently used"""
+    pdf_bytes = _pdf_cache.get(key)
+    if pdf_bytes is not None:
+        _pdf_cache.move_to_end(key)
+    return pdf_bytes
 
 
-# Global instance
-pdf_generator = PDFReportGenerator()
+def cache_pdf(key: str, pdf_bytes: bytes) -> None:
+    """Store a rendered PDF, evicting the least recently used beyond the limit"""
+    _pdf_cache[key] = pdf_bytes
+    _pdf_cache.move_to_end(key)
+    while len(_pdf_cache) > _PDF_CACHE_MAX_ENTRIES:
+        _pdf_cache.popitem(last=False)
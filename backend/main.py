@@ -3,31 +3,64 @@ FastAPI Backend for AI Privacy Footprint Analyzer
 Main application entry point
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse
 from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
 import uvicorn
 
+try:  # orjson is optional; without it responses use the stdlib encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
 from app.core.config import settings
 from app.api import api_router
 from app.db.mongodb import connect_to_mongo, close_mongo_connection
-from app.llm import llm_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events"""
     # Startup
+    # LangChain and the ML stack are imported here, not at module import,
+    # so loading the app (and each reload) stays fast
+    from app.llm import llm_service
+    from app.nlp import get_nlp_service
+    from app.ml import get_ml_service
+    
     llm_service.init_llm() # Initialize LLM service
+    # Load spaCy/Presidio and the risk model here rather than on the first
+    # request, where the load would block the event loop; routes get the same
+    # cached instances from get_nlp_service() / get_ml_service()
+    get_nlp_service()
+    get_ml_service()
     await connect_to_mongo()
     print("✅ Connected to MongoDB")
+    # PDF rendering is CPU-bound, so it runs in worker processes. Workers come
+    # from a forkserver (spawn where that doesn't exist, e.g. Windows): forking
+    # this process after Motor and the threadpool have started threads can
+    # deadlock the child
+    start_method = (
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    app.state.pdf_pool = ProcessPoolExecutor(
+        max_workers=min(settings.PDF_WORKERS, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context(start_method),
+    )
     print(f"🚀 Server running on http://{settings.HOST}:{settings.PORT}")
     
-    yield
-    
-    # Shutdown
-    await close_mongo_connection()
-    print("👋 Disconnected from MongoDB")
+    try:
+        yield
+    finally:
+        # Shutdown
+        app.state.pdf_pool.shutdown(cancel_futures=True)
+        await close_mongo_connection()
+        print("👋 Disconnected from MongoDB")
 
 
 # Create FastAPI application
@@ -37,6 +70,7 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
     lifespan=lifespan
 )
 
@@ -51,7 +85,22 @@ app.add_middleware(
 
 # Include API routes
 app.include_router(api_router, prefix=settings.API_V1_STR)
-app.include_router(api_router, prefix="/api")
+
+# Old clients call /api/...; when the canonical prefix differs, redirect them
+# instead of registering every route a second time
+if settings.API_V1_STR.rstrip("/") != "/api":
+    @app.middleware("http")
+    async def redirect_legacy_api_prefix(request: Request, call_next):
+        path = request.url.path
+        is_legacy = (
+            path.startswith("/api/")
+            and not path.startswith(settings.API_V1_STR + "/")
+            and path not in (app.docs_url, app.redoc_url)
+        )
+        if is_legacy:
+            target = request.url.replace(path=settings.API_V1_STR + path[len("/api"):])
+            return RedirectResponse(str(target), status_code=308)
+        return await call_next(request)
 
 
 @app.get("/")
@@ -79,6 +128,21 @@ async def health_check():
     }
 
 
+def preload_models():
+    """Warm the NLP/ML service caches before workers fork"""
+    from app.nlp import get_nlp_service
+    from app.ml import get_ml_service
+    
+    get_nlp_service()
+    get_ml_service()
+
+
+# Under `python main.py` the PDF workers (forkserver or spawn) re-import this
+# file as __mp_main__; they only render reports, so skip loading models there
+if settings.PRELOAD_MODELS and __name__ != "__mp_main__":
+    preload_models()
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
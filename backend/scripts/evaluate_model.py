@@ -3,21 +3,25 @@ Model Evaluation Script
 Generate comprehensive metrics and visualizations
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Only image files are written, so skip GUI backend probing
+import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.metrics import (
-    classification_report, confusion_matrix, 
-    accuracy_score, precision_recall_fscore_support,
-    roc_curve, auc
+    classification_report, confusion_matrix,
+    accuracy_score, roc_curve, auc
 )
 import joblib
+import logging
 import os
 import sys
+from pathlib import Path
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+logger = logging.getLogger(__name__)
+
 
 def load_model_and_data():
     """Load trained model and test data"""
@@ -27,15 +31,15 @@ def load_model_and_data():
     data_path = 'data/training_data.csv'
     
     if not os.path.exists(model_path):
-        print("❌ No trained model found. Run train_model.py first.")
+        logger.error("❌ No trained model found. Run train_model.py first.")
         return None, None, None, None
     
-    model = joblib.load(model_path)
-    scaler = joblib.load(scaler_path)
+    model = joblib.load(model_path, mmap_mode='r')
+    scaler = joblib.load(scaler_path, mmap_mode='r')
     
-    df = pd.read_csv(data_path)
-    X = df.drop('label', axis=1).values
-    y = df['label'].values
+    df = pd.read_csv(data_path, engine='pyarrow')
+    X = df.drop(columns='label').to_numpy(dtype=np.float32)
+    y = df['label'].to_numpy(dtype=np.int64)
     
     X_scaled = scaler.transform(X)
     
@@ -46,37 +50,49 @@ def generate_metrics_report(model, X, y):
     """Generate comprehensive metrics report"""
     
     y_pred = model.predict(X)
-    y_proba = model.predict_proba(X)
     
-    print("="*60)
-    print("MODEL EVALUATION REPORT")
-    print("="*60)
+    logger.info("=" * 60)
+    logger.info("MODEL EVALUATION REPORT")
+    logger.info("=" * 60)
     
-    # Overall Accuracy
+    # One classification report supplies every per-class metric
+    classes = ['LOW', 'MEDIUM', 'HIGH']
+    report = classification_report(
+        y, y_pred, labels=[0, 1, 2], target_names=classes,
+        output_dict=True, zero_division=0
+    )
+    
+    # Overall Accuracy (the report only has an 'accuracy' key when its labels
+    # cover every class present, so compute it directly)
     accuracy = accuracy_score(y, y_pred)
-    print(f"\n📊 Overall Accuracy: {accuracy:.4f} ({accuracy*100:.2f}%)")
+    logger.info("\n📊 Overall Accuracy: %.4f (%.2f%%)", accuracy, accuracy*100)
     
     # Per-class metrics
-    precision, recall, f1, support = precision_recall_fscore_support(y, y_pred)
+    precision = [report[cls]['precision'] for cls in classes]
+    recall = [report[cls]['recall'] for cls in classes]
+    f1 = [report[cls]['f1-score'] for cls in classes]
+    support = [int(report[cls]['support']) for cls in classes]
     
-    print("\n📈 Per-Class Metrics:")
-    print("-"*60)
-    classes = ['LOW', 'MEDIUM', 'HIGH']
+    logger.info("\n📈 Per-Class Metrics:")
+    logger.info("-" * 60)
     for i, cls in enumerate(classes):
-        print(f"{cls}:")
-        print(f"  Precision: {precision[i]:.4f}")
-        print(f"  Recall:    {recall[i]:.4f}")
-        print(f"  F1-Score:  {f1[i]:.4f}")
-        print(f"  Support:   {support[i]}")
-    
-    # Classification Report
-    print("\n📋 Full Classification Report:")
-    print(classification_report(y, y_pred, target_names=classes))
+        logger.info("%s:", cls)
+        logger.info("  Precision: %.4f", precision[i])
+        logger.info("  Recall:    %.4f", recall[i])
+        logger.info("  F1-Score:  %.4f", f1[i])
+        logger.info("  Support:   %s", support[i])
+    
+    # Averages
+    logger.info("\n📋 Averages:")
+    for avg in ('macro avg', 'weighted avg'):
+        row = report[avg]
+        logger.info("  %-13s precision %.4f  recall %.4f  f1-score %.4f  support %d",
+                    avg, row['precision'], row['recall'], row['f1-score'], row['support'])
     
     # Confusion Matrix
-    print("\n🔢 Confusion Matrix:")
-    cm = confusion_matrix(y, y_pred)
-    print(cm)
+    logger.info("\n🔢 Confusion Matrix:")
+    cm = confusion_matrix(y, y_pred, labels=[0, 1, 2])
+    logger.info("%s", cm)
     
     return {
         'accuracy': accuracy,
@@ -84,36 +100,43 @@ def generate_metrics_report(model, X, y):
         'recall': recall,
         'f1': f1,
         'confusion_matrix': cm,
-        'y_pred': y_pred,
-        'y_proba': y_proba
+        'y_pred': y_pred
     }
 
 
-def plot_confusion_matrix(cm, save_path='results/confusion_matrix.png'):
+def plot_confusion_matrix(cm, save_path='results/confusion_matrix.svg'):
     """Plot confusion matrix heatmap"""
     
     os.makedirs('results', exist_ok=True)
     
+    labels = ['LOW', 'MEDIUM', 'HIGH']
     plt.figure(figsize=(8, 6))
-    sns.heatmap(
-        cm, annot=True, fmt='d', cmap='Blues',
-        xticklabels=['LOW', 'MEDIUM', 'HIGH'],
-        yticklabels=['LOW', 'MEDIUM', 'HIGH']
-    )
+    plt.imshow(cm, cmap='Blues')
+    plt.colorbar()
+    plt.xticks(range(len(labels)), labels)
+    plt.yticks(range(len(labels)), labels)
+    
+    # Annotate each cell with its count, in white on the darker cells
+    threshold = cm.max() / 2
+    for (i, j), count in np.ndenumerate(cm):
+        plt.text(j, i, f'{count:d}', ha='center', va='center',
+                 color='white' if count > threshold else 'black')
+    
     plt.title('Confusion Matrix - Privacy Risk Classification')
     plt.ylabel('True Label')
     plt.xlabel('Predicted Label')
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"✅ Confusion matrix saved to {save_path}")
+    # Vector output by default; dpi only applies if a raster path is given
+    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    logger.info("✅ Confusion matrix saved to %s", save_path)
     plt.close()
 
 
-def plot_feature_importance(model, save_path='results/feature_importance.png'):
+def plot_feature_importance(model, save_path='results/feature_importance.svg'):
     """Plot feature importance"""
     
     if not hasattr(model, 'feature_importances_'):
-        print("⚠️  Model does not support feature importance")
+        logger.warning("⚠️  Model does not support feature importance")
         return
     
     feature_names = [
@@ -123,56 +146,61 @@ def plot_feature_importance(model, save_path='results/feature_importance.png'):
     ]
     
     importances = model.feature_importances_
-    indices = np.argsort(importances)[::-1]
+    names = np.asarray(feature_names)
+    order = np.argsort(importances)[::-1]
     
     plt.figure(figsize=(10, 6))
-    plt.bar(range(len(importances)), importances[indices])
-    plt.xticks(range(len(importances)), [feature_names[i] for i in indices], rotation=45, ha='right')
+    plt.bar(names[order], importances[order])
+    plt.xticks(rotation=45, ha='right')
     plt.title('Feature Importance - Random Forest Model')
     plt.ylabel('Importance Score')
     plt.xlabel('Features')
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"✅ Feature importance plot saved to {save_path}")
+    # Vector output by default; dpi only applies if a raster path is given
+    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    logger.info("✅ Feature importance plot saved to %s", save_path)
     plt.close()
 
 
-def generate_latex_table(metrics):
-    """Generate LaTeX table for academic report"""
-    
-    latex = """
-\\begin{table}[h]
+_LATEX_TABLE_TEMPLATE = """
+\\begin{{table}}[h]
 \\centering
-\\caption{Privacy Risk Classification Results}
-\\begin{tabular}{|l|c|c|c|}
+\\caption{{Privacy Risk Classification Results}}
+\\begin{{tabular}}{{|l|c|c|c|}}
 \\hline
-\\textbf{Class} & \\textbf{Precision} & \\textbf{Recall} & \\textbf{F1-Score} \\\\
+\\textbf{{Class}} & \\textbf{{Precision}} & \\textbf{{Recall}} & \\textbf{{F1-Score}} \\\\
 \\hline
-"""
-    
-    classes = ['LOW', 'MEDIUM', 'HIGH']
-    for i, cls in enumerate(classes):
-        latex += f"{cls} & {metrics['precision'][i]:.3f} & {metrics['recall'][i]:.3f} & {metrics['f1'][i]:.3f} \\\\\n"
-    
-    latex += f"""\\hline
-\\textbf{{Overall Accuracy}} & \\multicolumn{{3}}{{c|}}{{{metrics['accuracy']:.3f}}} \\\\
+{rows}
+\\hline
+\\textbf{{Overall Accuracy}} & \\multicolumn{{3}}{{c|}}{{{accuracy:.3f}}} \\\\
 \\hline
 \\end{{tabular}}
 \\end{{table}}
 """
+
+
+def generate_latex_table(metrics):
+    """Generate LaTeX table for academic report"""
+    
+    classes = ['LOW', 'MEDIUM', 'HIGH']
+    rows = [
+        f"{cls} & {metrics['precision'][i]:.3f} & {metrics['recall'][i]:.3f} & {metrics['f1'][i]:.3f} \\\\"
+        for i, cls in enumerate(classes)
+    ]
+    latex = _LATEX_TABLE_TEMPLATE.format(rows='\n'.join(rows), accuracy=metrics['accuracy'])
     
     # Save to file
-    os.makedirs('results', exist_ok=True)
-    with open('results/metrics_table.tex', 'w') as f:
-        f.write(latex)
+    output_path = Path('results/metrics_table.tex')
+    output_path.parent.mkdir(exist_ok=True)
+    output_path.write_text(latex)
     
-    print("✅ LaTeX table saved to results/metrics_table.tex")
+    logger.info("✅ LaTeX table saved to %s", output_path.as_posix())
 
 
 def main():
     """Run full evaluation"""
     
-    print("🚀 Starting Model Evaluation\n")
+    logger.info("🚀 Starting Model Evaluation\n")
     
     # Load model and data
     model, scaler, X, y = load_model_and_data()
@@ -184,16 +212,17 @@ def main():
     metrics = generate_metrics_report(model, X, y)
     
     # Generate visualizations
-    print("\n📊 Generating visualizations...")
+    logger.info("\n📊 Generating visualizations...")
     plot_confusion_matrix(metrics['confusion_matrix'])
     plot_feature_importance(model)
     
     # Generate LaTeX table
-    print("\n📄 Generating LaTeX table...")
+    logger.info("\n📄 Generating LaTeX table...")
     generate_latex_table(metrics)
     
-    print("\n✅ Evaluation complete! Check 'results/' folder for outputs.")
+    logger.info("\n✅ Evaluation complete! Check 'results/' folder for outputs.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()